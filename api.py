@@ -6,16 +6,159 @@ and delegates to `tools.unifero.UniferoTool.process_request`.
 Endpoints:
 - GET /health -> basic liveness
 - POST /process -> accept JSON body and return the same output as the CLI
+- POST /process_batch -> run several /process bodies concurrently in one call
 
 Run with: uvicorn api:app --reload
+
+For production, use the faster uvloop event loop and httptools parser (both
+installed by uvicorn[standard]) and one worker per core:
+
+    uvicorn api:app --loop uvloop --http httptools --workers $(nproc)
+
+or simply `python3 api.py`, which does the same.
+
+The worker threadpool size can be tuned with the UNIFERO_THREADPOOL_SIZE
+environment variable (default: 64). Complete results with capped content are
+cached in-process for UNIFERO_CACHE_TTL seconds (default: 300, 0 disables the
+cache). Setting UNIFERO_DNS_CACHE_TTL to a positive number of seconds caches
+DNS lookups for that long (default: 0, disabled; see
+tools.unifero.enable_dns_cache).
 """
-from typing import Any, Dict
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Tuple
+
+import anyio.to_thread
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, ConfigDict
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ConfigDict, Field
+
+from tools.unifero import VALID_MODES, UniferoTool, enable_dns_cache
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json responses
+    orjson = None
+
+# Sync endpoints run on anyio's default threadpool (40 threads out of the box).
+# Requests spend most of their time waiting on upstream HTTP, so allow more.
+THREADPOOL_SIZE = int(os.environ.get("UNIFERO_THREADPOOL_SIZE", "64"))
+
+# Upper bound on the number of requests accepted by /process_batch
+MAX_BATCH_SIZE = 20
+
+# Result cache settings; both modes are read-only lookups, so identical
+# params can safely share a recent result.
+CACHE_TTL = float(os.environ.get("UNIFERO_CACHE_TTL", "300"))
+CACHE_MAXSIZE = 256
+
+# Opt-in DNS cache lifetime; 0 leaves socket.getaddrinfo untouched
+DNS_CACHE_TTL = float(os.environ.get("UNIFERO_DNS_CACHE_TTL", "0"))
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (much faster on large result payloads)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    if DNS_CACHE_TTL > 0:
+        enable_dns_cache(DNS_CACHE_TTL)
+    yield
+
+
+app = FastAPI(
+    title="unifero-cli API",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
+)
+# Search/docs payloads are repetitive text, so they compress very well; small
+# bodies (health, errors) are sent as-is.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# UniferoTool holds no per-request state, so a single shared instance is
+# safe to reuse across requests and worker threads.
+_TOOL = UniferoTool()
+
+_cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _is_complete(out: Any) -> bool:
+    """Return True if out has results and every page in it was fetched.
 
-from tools.unifero import UniferoTool
+    Upstream failures (a DuckDuckGo error or rate limit, an unreachable doc
+    page) come back as empty results or items without content rather than
+    exceptions; those must not be served to other callers from the cache.
+    """
+    results = out.get("results") if isinstance(out, dict) else None
+    if not results:
+        return False
+    for item in results:
+        if item.get("fetched") is False or ("content" in item and item["content"] is None):
+            return False
+    return True
 
-app = FastAPI(title="unifero-cli API")
+
+def _has_bounded_content(params: Dict[str, Any]) -> bool:
+    """Return True if params cap the extracted text per page (see process_request).
+
+    Without a cap, docs mode returns the full text of up to 10 pages, which is
+    too large to keep CACHE_MAXSIZE copies of.
+    """
+    if params.get("mode", "search") == "search":
+        limit = params.get("content_len", 2000)
+    elif not params.get("include_content", True):
+        return True
+    else:
+        limit = params.get("content_limit")
+    try:
+        # negative limits slice from the end, keeping nearly everything
+        return limit is not None and int(limit) >= 0
+    except (TypeError, ValueError):
+        return False
+
+
+def _cached_process(params: Dict[str, Any]) -> Any:
+    """Call _TOOL.process_request, reusing results for identical params.
+
+    Entries expire after CACHE_TTL seconds and the least recently used entry
+    is evicted beyond CACHE_MAXSIZE. Errors, incomplete results (see
+    _is_complete) and results with uncapped content are never cached.
+    """
+    # reject unknown modes up front, before cache-key building or the tool
+    if params.get("mode", "search") not in VALID_MODES:
+        raise ValueError("Invalid mode. Use 'search' or 'docs'.")
+    if CACHE_TTL <= 0 or not _has_bounded_content(params):
+        return _TOOL.process_request(params)
+
+    key = json.dumps(params, sort_keys=True, default=str)
+    now = time.monotonic()
+    with _cache_lock:
+        hit = _cache.get(key)
+        if hit is not None and now - hit[0] < CACHE_TTL:
+            _cache.move_to_end(key)
+            return hit[1]
+
+    out = _TOOL.process_request(params)
+    if not _is_complete(out):
+        return out
+    with _cache_lock:
+        _cache[key] = (now, out)
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_MAXSIZE:
+            _cache.popitem(last=False)
+    return out
 
 
 class ProcessRequest(BaseModel):
@@ -24,6 +167,20 @@ class ProcessRequest(BaseModel):
     model_config = ConfigDict(extra="allow")
 
 
+class BatchRequest(BaseModel):
+    requests: List[ProcessRequest] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+def _process_item(index: int, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one batch entry, mapping errors to the status codes /process uses."""
+    try:
+        return {"id": index, "status": 200, "body": _cached_process(params)}
+    except ValueError as e:
+        return {"id": index, "status": 400, "body": {"detail": str(e)}}
+    except Exception as e:
+        return {"id": index, "status": 500, "body": {"detail": str(e)}}
+
+
 @app.get("/health")
 def health() -> Dict[str, Any]:
     return {"status": "ok"}
@@ -31,13 +188,31 @@ def health() -> Dict[str, Any]:
 
 @app.post("/process")
 def process(request: ProcessRequest) -> Any:
-    params = request.dict()
+    # Intentionally a plain `def`: process_request does blocking network I/O,
+    # so FastAPI dispatches this handler to the threadpool instead of running
+    # it on (and stalling) the event loop.
+    params = request.model_dump()
     try:
-        tool = UniferoTool()
-        out = tool.process_request(params)
+        out = _cached_process(params)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         # for unexpected errors, return 500 with message
         raise HTTPException(status_code=500, detail=str(e))
     return out
+
+
+@app.post("/process_batch")
+async def process_batch(batch: BatchRequest) -> List[Dict[str, Any]]:
+    # Each entry blocks on network I/O, so fan them out over the threadpool
+    # and wait for all of them; results keep the order of the request list.
+    return await asyncio.gather(*[
+        anyio.to_thread.run_sync(_process_item, i, r.model_dump())
+        for i, r in enumerate(batch.requests)
+    ])
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run("api:app", loop="uvloop", http="httptools", workers=os.cpu_count())
@@ -10,14 +10,29 @@ import json
 import os
 import argparse
 import logging
+import select
 from typing import Optional, Dict, Any
 
-from tools.unifero import UniferoTool
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    orjson = None
 
 # Configure logging
 logging.basicConfig(level=logging.WARNING, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+# Optional limit (seconds) on waiting for piped stdin; unset or 0 blocks
+# until the producer writes or closes the pipe, as a plain read() would
+STDIN_TIMEOUT = float(os.environ.get("UNIFERO_STDIN_TIMEOUT", "0"))
+
+# Opt-in DNS cache lifetime (seconds); 0 leaves socket.getaddrinfo untouched
+DNS_CACHE_TTL = float(os.environ.get("UNIFERO_DNS_CACHE_TTL", "0"))
+
+# Mirrors tools.unifero.VALID_MODES; kept local so the CLI can reject bad
+# input without importing the networking stack
+_VALID_MODES = frozenset({"search", "docs"})
+
 # Collection of example inputs for help/examples
 EXAMPLE_INPUTS = {
     "search_minimal": {"mode": "search", "query": "Next.js routing"},
@@ -27,28 +42,30 @@ EXAMPLE_INPUTS = {
 }
 
 
+# --examples output is static, so render it once at import time
+_EXAMPLES_TEXT = "Example JSON inputs (for backward compatibility):\n\n" + "".join(
+    f"# {name}\n{json.dumps(item, indent=2)}\n\n" for name, item in EXAMPLE_INPUTS.items()
+)
+
+_USAGE_TEXT = """Modern CLI usage examples:
+
+# Search examples:
+python3 main.py --search 'Next.js routing'
+python3 main.py --search 'React hooks' --limit 5 --snippet-len 200
+
+# Docs examples:
+python3 main.py --docs 'https://ai-sdk.dev/docs/ai-sdk-ui/chatbot'
+python3 main.py --docs 'https://nextjs.org/docs' --limit 3 --content-limit 2000
+
+# Output to file:
+python3 main.py --search 'Python FastAPI' --output results.json
+
+"""
+
+
 def print_examples():
     """Print example usage patterns."""
-    print("Example JSON inputs (for backward compatibility):")
-    print()
-    for name, item in EXAMPLE_INPUTS.items():
-        print(f"# {name}")
-        print(json.dumps(item, indent=2))
-        print()
-    
-    print("Modern CLI usage examples:")
-    print()
-    print("# Search examples:")
-    print("python3 main.py --search 'Next.js routing'")
-    print("python3 main.py --search 'React hooks' --limit 5 --snippet-len 200")
-    print()
-    print("# Docs examples:")
-    print("python3 main.py --docs 'https://ai-sdk.dev/docs/ai-sdk-ui/chatbot'")
-    print("python3 main.py --docs 'https://nextjs.org/docs' --limit 3 --content-limit 2000")
-    print()
-    print("# Output to file:")
-    print("python3 main.py --search 'Python FastAPI' --output results.json")
-    print()
+    sys.stdout.write(_EXAMPLES_TEXT + _USAGE_TEXT)
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -133,6 +150,10 @@ Examples:
     return parser
 
 
+# Built once at import; argparse parsers are reusable across parse_args calls
+_PARSER = create_parser()
+
+
 def validate_args(args: argparse.Namespace) -> Optional[str]:
     """Validate argument combinations and return error message if invalid."""
     if args.examples:
@@ -156,41 +177,50 @@ def validate_args(args: argparse.Namespace) -> Optional[str]:
     return None
 
 
+# Pre-sized parameter templates; args_to_params copies and fills these in
+_SEARCH_TMPL: Dict[str, Any] = {"mode": "search", "query": None, "limit": 0, "snippet_len": 0, "content_len": 0}
+_DOCS_TMPL: Dict[str, Any] = {"mode": "docs", "url": None, "limit": 0, "include_content": True, "content_limit": 0}
+
+
 def args_to_params(args: argparse.Namespace) -> Dict[str, Any]:
     """Convert parsed arguments to unifero tool parameters."""
     if args.search:
-        return {
-            "mode": "search",
-            "query": args.search,
-            "limit": args.limit,
-            "snippet_len": args.snippet_len,
-            "content_len": args.content_len
-        }
+        params = _SEARCH_TMPL.copy()
+        params["query"] = args.search
+        params["limit"] = args.limit
+        params["snippet_len"] = args.snippet_len
+        params["content_len"] = args.content_len
+        return params
     elif args.docs:
-        return {
-            "mode": "docs", 
-            "url": args.docs,
-            "limit": min(args.limit, 10),  # Enforce docs limit
-            "include_content": not args.no_content,
-            "content_limit": args.content_len
-        }
+        params = _DOCS_TMPL.copy()
+        params["url"] = args.docs
+        params["limit"] = args.limit  # validate_args rejects docs limits above 10
+        params["include_content"] = not args.no_content
+        params["content_limit"] = args.content_len
+        return params
     else:
         raise ValueError("No valid mode specified")
 
 
-def format_output(data: Any, compact: bool = False) -> str:
-    """Format output according to specified options."""
+def encode_output(data: Any, compact: bool = False) -> bytes:
+    """Serialize output to UTF-8 JSON bytes according to specified options."""
+    if orjson is not None:
+        return orjson.dumps(data, option=0 if compact else orjson.OPT_INDENT_2)
     if compact:
-        return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
     else:
-        return json.dumps(data, indent=2, ensure_ascii=False)
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
 
+def write_output(data: Any, compact: bool, output_file: Optional[str]) -> None:
+    """Write JSON-encoded data to file or stdout with proper error handling.
 
-def write_output(content: str, output_file: Optional[str]) -> None:
-    """Write content to file or stdout with proper error handling."""
+    Output is written as bytes so large docs results are not re-encoded.
+    """
+    content = encode_output(data, compact)
     if output_file:
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
+            with open(output_file, 'wb', buffering=1 << 20) as f:
                 f.write(content)
             print(f"✅ Output written to {output_file}", file=sys.stderr)
         except PermissionError:
@@ -200,7 +230,28 @@ def write_output(content: str, output_file: Optional[str]) -> None:
             print(f"❌ Error writing to {output_file}: {e}", file=sys.stderr)
             sys.exit(1)
     else:
-        print(content)
+        stdout_buffer = getattr(sys.stdout, 'buffer', None)
+        if stdout_buffer is None:
+            # stdout replaced by a text-only stream (e.g. io.StringIO)
+            print(content.decode('utf-8'))
+            return
+        sys.stdout.flush()
+        stdout_buffer.write(content + b"\n")
+        stdout_buffer.flush()
+
+
+def read_piped_stdin(timeout: float = STDIN_TIMEOUT) -> str:
+    """Read piped stdin, failing loudly if timeout > 0 passes with nothing to read."""
+    if timeout > 0:
+        try:
+            ready, _, _ = select.select([sys.stdin], [], [], timeout)
+        except (OSError, ValueError):
+            # select() only works on sockets on Windows; keep the blocking read there
+            ready = [sys.stdin]
+        if not ready:
+            print(f"❌ No input on stdin after {timeout:g}s (UNIFERO_STDIN_TIMEOUT)", file=sys.stderr)
+            sys.exit(1)
+    return sys.stdin.read().strip()
 
 
 def legacy_json_mode(json_input: str) -> None:
@@ -215,10 +266,18 @@ def legacy_json_mode(json_input: str) -> None:
         print("❌ JSON input must be an object", file=sys.stderr)
         sys.exit(1)
 
+    if params.get("mode", "search") not in _VALID_MODES:
+        print("❌ Invalid parameters: Invalid mode. Use 'search' or 'docs'.", file=sys.stderr)
+        sys.exit(1)
+
     try:
+        from tools.unifero import UniferoTool, enable_dns_cache
+
+        if DNS_CACHE_TTL > 0:
+            enable_dns_cache(DNS_CACHE_TTL)
         tool = UniferoTool()
         result = tool.process_request(params)
-        print(format_output(result))
+        write_output(result, False, None)
     except ValueError as e:
         print(f"❌ Invalid parameters: {e}", file=sys.stderr)
         sys.exit(1)
@@ -231,7 +290,7 @@ def legacy_json_mode(json_input: str) -> None:
 def _cli_main():
     """Main CLI entry point with enhanced error handling."""
     try:
-        parser = create_parser()
+        parser = _PARSER
         args = parser.parse_args()
         
         # Handle examples
@@ -253,15 +312,10 @@ def _cli_main():
             
             # Check for piped input (legacy support)
             if not sys.stdin.isatty():
-                try:
-                    piped_input = sys.stdin.read().strip()
-                    if piped_input:
-                        legacy_json_mode(piped_input)
-                        return
-                except EOFError:
-                    pass
-                except Exception as e:
-                    logger.debug(f"Error reading from stdin: {e}")
+                piped_input = read_piped_stdin()
+                if piped_input:
+                    legacy_json_mode(piped_input)
+                    return
             
             # Show help if no input provided
             parser.print_help()
@@ -283,6 +337,11 @@ def _cli_main():
         
         # Execute the request
         try:
+            # Imported lazily so --help/--examples don't pay for requests/lxml
+            from tools.unifero import UniferoTool, enable_dns_cache
+
+            if DNS_CACHE_TTL > 0:
+                enable_dns_cache(DNS_CACHE_TTL)
             tool = UniferoTool()
             
             # Show progress for long operations
@@ -294,8 +353,7 @@ def _cli_main():
             result = tool.process_request(params)
             
             # Format and output result
-            formatted = format_output(result, args.compact)
-            write_output(formatted, args.output)
+            write_output(result, args.compact, args.output)
             
         except ValueError as e:
             print(f"❌ Invalid parameters: {e}", file=sys.stderr)
@@ -319,11 +377,3 @@ def _cli_main():
 
 if __name__ == "__main__":
     _cli_main()
-
-
-if __name__ == "__main__":
-    _cli_main()
-
-
-if __name__ == "__main__":
-    _cli_main()
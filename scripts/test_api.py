@@ -1,15 +1,21 @@
 #!/usr/bin/env python3
 """Test runner for the unifero-cli FastAPI server.
 
-Sends a collection of predefined JSON payloads to POST /process and writes
-the request+response details to output.txt in the project root.
+Sends a collection of predefined JSON payloads to POST /process and appends
+the request+response details to output.txt in the project root, one JSON
+object per line (after a "# Test run: <timestamp>" header line).
 
 Usage:
   source .venv/bin/activate
   python3 scripts/test_api.py
 
 You can override the server URL with the SERVER_URL env var.
+
+All cases are sent concurrently through one pooled httpx.AsyncClient, which
+negotiates HTTP/2 (multiplexed on a single connection) when the server
+supports it, e.g. an HTTPS deployment.
 """
+import asyncio
 import os
 import time
 import json
@@ -17,17 +23,33 @@ import logging
 from datetime import datetime
 from typing import Dict, Any, List, Tuple
 
-import requests
+import httpx
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to stdlib json
+    orjson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
+# httpx logs every request at INFO; the runner prints its own per-case summary
+logging.getLogger("httpx").setLevel(logging.WARNING)
 
 # Configuration
 SERVER_URL = os.environ.get("SERVER_URL", "http://127.0.0.1:8000")
 ENDPOINT = f"{SERVER_URL}/process"
 HEALTH = f"{SERVER_URL}/health"
 OUTPUT_PATH = os.path.join(os.getcwd(), "output.txt")
+MAX_ATTEMPTS = 2
+
+
+def _dumps_line(record: Dict[str, Any]) -> bytes:
+    """Encode a result record as a single JSON Lines entry."""
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n"
+
 
 # Test cases covering various scenarios
 TEST_CASES: List[Tuple[str, Dict[str, Any]]] = [
@@ -41,73 +63,80 @@ TEST_CASES: List[Tuple[str, Dict[str, Any]]] = [
 ]
 
 
-def run_case(name: str, payload: dict, retries: int = 2, timeout: int = 10) -> dict:
+async def run_case(client: httpx.AsyncClient, name: str, payload: dict, timeout: int = 10) -> dict:
     start = time.time()
     last_exc = None
-    for attempt in range(1, retries + 1):
+    for attempt in range(1, MAX_ATTEMPTS + 1):
         try:
-            resp = requests.post(ENDPOINT, json=payload, timeout=timeout)
-            elapsed = time.time() - start
-            try:
-                body = resp.json()
-            except Exception:
-                body = resp.text
-            return {
-                "name": name,
-                "request": payload,
-                "status_code": resp.status_code,
-                "response": body,
-                "elapsed": elapsed,
-                "attempts": attempt,
-            }
+            resp = await client.post(ENDPOINT, json=payload, timeout=timeout)
         except Exception as e:
             last_exc = e
-            time.sleep(0.5 * attempt)
+            await asyncio.sleep(0.5 * attempt)
+            continue
+
+        elapsed = time.time() - start
+        try:
+            body = orjson.loads(resp.content) if orjson is not None else resp.json()
+        except Exception:
+            body = resp.text
+        return {
+            "name": name,
+            "request": payload,
+            "status_code": resp.status_code,
+            "response": body,
+            "elapsed": elapsed,
+            "attempts": attempt,
+        }
 
-    elapsed = time.time() - start
     return {
         "name": name,
         "request": payload,
         "status_code": None,
         "response": str(last_exc),
-        "elapsed": elapsed,
-        "attempts": retries,
+        "elapsed": time.time() - start,
+        "attempts": MAX_ATTEMPTS,
     }
 
 
-def main():
-    print(f"Running {len(TEST_CASES)} tests against {ENDPOINT}")
-
-    # wait for health
-    ready = False
+async def wait_for_health(client: httpx.AsyncClient) -> bool:
     for i in range(20):
         try:
-            h = requests.get(HEALTH, timeout=2)
+            h = await client.get(HEALTH, timeout=2)
             if h.status_code == 200:
-                ready = True
-                break
+                return True
         except Exception:
             pass
-        time.sleep(0.25)
+        await asyncio.sleep(0.25)
+    return False
 
-    if not ready:
-        print(f"WARNING: {HEALTH} did not respond; tests will still attempt requests and may fail.")
 
-    now = datetime.utcnow().isoformat() + "Z"
-    with open(OUTPUT_PATH, "a", encoding="utf-8") as f:
-        f.write("# Test run: " + now + "\n")
+async def run_all() -> None:
+    print(f"Running {len(TEST_CASES)} tests against {ENDPOINT}")
 
-    for name, payload in TEST_CASES:
-        print(f"- {name} -> sending...", end=" ")
-        r = run_case(name, payload)
-        print(f"done (status={r['status_code']}) in {r['elapsed']:.2f}s, attempts={r.get('attempts')}")
-        # write each result immediately so partial runs are preserved
-        with open(OUTPUT_PATH, "a", encoding="utf-8") as f:
-            f.write(json.dumps(r, indent=2, ensure_ascii=False))
-            f.write("\n\n")
+    limits = httpx.Limits(max_connections=len(TEST_CASES), max_keepalive_connections=20)
+    async with httpx.AsyncClient(http2=True, limits=limits) as client:
+        if not await wait_for_health(client):
+            print(f"WARNING: {HEALTH} did not respond; tests will still attempt requests and may fail.")
+
+        now = datetime.utcnow().isoformat() + "Z"
+        with open(OUTPUT_PATH, "ab", buffering=1 << 16) as f:
+            f.write(f"# Test run: {now}\n".encode("utf-8"))
+            # cases are independent, so send them all at once and record each
+            # result as it completes
+            tasks = [run_case(client, name, payload) for name, payload in TEST_CASES]
+            for next_done in asyncio.as_completed(tasks):
+                r = await next_done
+                print(f"- {r['name']} -> done (status={r['status_code']}) in {r['elapsed']:.2f}s, attempts={r.get('attempts')}")
+                f.write(_dumps_line(r))
+                # flush each result so partial runs are preserved
+                f.flush()
 
     print(f"Appended results to {OUTPUT_PATH}")
 
 
+def main():
+    asyncio.run(run_all())
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,56 @@
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import api
+
+
+@pytest.fixture
+def client(monkeypatch):
+    def fake_process_request(params):
+        if params.get("query") == "boom":
+            raise RuntimeError("upstream exploded")
+        if "query" not in params:
+            raise ValueError("'query' is required for search mode")
+        # later entries finish first, so ordering can't come from completion order
+        time.sleep(params.get("delay", 0))
+        return {"query": params["query"], "results": [{"url": "https://example.com", "content": "text"}]}
+
+    monkeypatch.setattr(api._TOOL, 'process_request', fake_process_request)
+    monkeypatch.setattr(api, 'CACHE_TTL', 0)
+    with TestClient(api.app) as c:
+        yield c
+
+
+def test_process_batch_keeps_request_order(client):
+    queries = [{"mode": "search", "query": f"q{i}", "delay": 0.05 * (3 - i)} for i in range(4)]
+
+    resp = client.post("/process_batch", json={"requests": queries})
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [item["id"] for item in body] == [0, 1, 2, 3]
+    assert [item["body"]["query"] for item in body] == ["q0", "q1", "q2", "q3"]
+    assert all(item["status"] == 200 for item in body)
+
+
+def test_process_batch_maps_item_errors(client):
+    resp = client.post("/process_batch", json={"requests": [
+        {"mode": "search", "query": "ok"},
+        {"mode": "bogus", "query": "x"},
+        {"mode": "search"},
+        {"mode": "search", "query": "boom"},
+    ]})
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [item["status"] for item in body] == [200, 400, 400, 500]
+    assert body[1]["body"] == {"detail": "Invalid mode. Use 'search' or 'docs'."}
+    assert body[3]["body"] == {"detail": "upstream exploded"}
+
+
+@pytest.mark.parametrize("size", [0, api.MAX_BATCH_SIZE + 1])
+def test_process_batch_rejects_bad_batch_sizes(client, size):
+    resp = client.post("/process_batch", json={"requests": [{"mode": "search", "query": "q"}] * size})
+    assert resp.status_code == 422
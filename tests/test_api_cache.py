@@ -0,0 +1,112 @@
+import pytest
+
+import api
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    api._cache.clear()
+    yield
+    api._cache.clear()
+
+
+def test_cached_process_reuses_results(monkeypatch):
+    calls = []
+
+    def fake_process_request(params):
+        calls.append(params)
+        return {"query": params["query"], "results": [{"url": "https://example.com", "content": "text"}]}
+
+    monkeypatch.setattr(api._TOOL, 'process_request', fake_process_request)
+
+    first = api._cached_process({"mode": "search", "query": "q", "limit": 2})
+    # same params in a different key order hit the cache
+    second = api._cached_process({"limit": 2, "query": "q", "mode": "search"})
+    api._cached_process({"mode": "search", "query": "other"})
+
+    assert first == second
+    assert len(calls) == 2
+
+
+def test_cached_process_does_not_cache_errors(monkeypatch):
+    calls = []
+
+    def fake_process_request(params):
+        calls.append(params)
+        raise ValueError("'query' is required for search mode")
+
+    monkeypatch.setattr(api._TOOL, 'process_request', fake_process_request)
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            api._cached_process({"mode": "search"})
+
+    assert len(calls) == 2
+    assert not api._cache
+
+
+@pytest.mark.parametrize("out", [
+    {"query": "q", "results": []},
+    {"query": "q", "results": [{"url": "https://example.com", "content": None}]},
+    {"base_url": "https://example.com/docs", "results": [{"url": "https://example.com/docs", "fetched": False}]},
+])
+def test_cached_process_does_not_cache_incomplete_results(monkeypatch, out):
+    calls = []
+    monkeypatch.setattr(api._TOOL, 'process_request', lambda params: calls.append(params) or out)
+
+    assert api._cached_process({"mode": "search", "query": "q"}) == out
+    api._cached_process({"mode": "search", "query": "q"})
+
+    assert len(calls) == 2
+    assert not api._cache
+
+
+@pytest.mark.parametrize("params", [
+    {"mode": "docs", "url": "https://example.com/docs"},
+    {"mode": "docs", "url": "https://example.com/docs", "content_limit": -1},
+    {"mode": "search", "query": "q", "content_len": None},
+])
+def test_cached_process_skips_uncapped_content(monkeypatch, params):
+    calls = []
+    out = {"results": [{"url": "https://example.com/docs", "content": "text", "fetched": True}]}
+    monkeypatch.setattr(api._TOOL, 'process_request', lambda p: calls.append(p) or out)
+
+    api._cached_process(params)
+    api._cached_process(params)
+
+    assert len(calls) == 2
+    assert not api._cache
+
+
+def test_cached_process_caches_capped_docs(monkeypatch):
+    calls = []
+    out = {"results": [{"url": "https://example.com/docs", "content": "text", "fetched": True}]}
+    monkeypatch.setattr(api._TOOL, 'process_request', lambda p: calls.append(p) or out)
+
+    for params in ({"mode": "docs", "url": "https://example.com/docs", "content_limit": 500},
+                   {"mode": "docs", "url": "https://example.com/docs", "include_content": False}):
+        api._cached_process(params)
+        api._cached_process(params)
+
+    assert len(calls) == 2
+
+
+def test_cached_process_disabled_with_zero_ttl(monkeypatch):
+    calls = []
+    monkeypatch.setattr(api, 'CACHE_TTL', 0)
+    monkeypatch.setattr(api._TOOL, 'process_request', lambda params: calls.append(params) or {})
+
+    api._cached_process({"mode": "docs", "url": "https://example.com/docs"})
+    api._cached_process({"mode": "docs", "url": "https://example.com/docs"})
+
+    assert len(calls) == 2
+
+
+def test_cached_process_rejects_unknown_mode(monkeypatch):
+    def fake_process_request(params):
+        raise AssertionError("tool should not be called for an unknown mode")
+
+    monkeypatch.setattr(api._TOOL, 'process_request', fake_process_request)
+
+    with pytest.raises(ValueError):
+        api._cached_process({"mode": "bogus", "query": "x"})
@@ -0,0 +1,239 @@
+import socket
+
+import httpx
+import pytest
+
+from tools.unifero import (
+    crawl_docs,
+    duckduckgo_search,
+    enable_dns_cache,
+    extract_doc_content_html,
+    extract_html_title_and_paragraphs,
+    fetch_docs_data,
+    safe_get,
+)
+
+
+PAGE = b"""<!DOCTYPE html>
+<html>
+<head>
+  <title>Routing Guide | Example Docs</title>
+  <link rel="stylesheet" href="/style.css">
+  <link rel="shortcut icon" href="/favicon.ico">
+  <meta property="og:image" content="/img/og.png">
+  <script>var x = "should not appear in output at all";</script>
+</head>
+<body>
+  <header><p>Header text that should be removed entirely</p></header>
+  <nav><ul><li><a href="/docs/intro">Introduction to the docs site</a></li></ul></nav>
+  <main>
+    <h1>Getting Started</h1>
+    <p>Routing lets you map URLs to pages in your application easily.</p>
+    <ul><li>Use the <code>app</code> directory for new projects today.</li><li>tiny</li></ul>
+    <pre><code>export default function Page() {
+  return &lt;h1&gt;Hello&lt;/h1&gt;
+}</code></pre>
+    <p>Caf\xc3\xa9 \xe2\x80\x94 unicode content should survive the parser round trip.</p>
+  </main>
+  <footer><p>Footer text that should be removed entirely</p></footer>
+</body>
+</html>
+"""
+
+
+SEARCH_PAGE = b"""<html><body>
+<a class="result__a" href="//duckduckgo.com/l/?uddg=https%3A%2F%2Fnextjs.org%2Fdocs&rut=x">Next.js Docs</a>
+<a class="large result-link" href="https://vercel.com/guides">Guides</a>
+<a class="result__a" href="https://nextjs.org/docs">Duplicate</a>
+<a href="#top">Top</a>
+<a href="https://duckduckgo.com/about">About</a>
+</body></html>
+"""
+
+
+DOCS_SITE = {
+    "https://example.com/docs": b'<a href="/docs/a">A</a><a href="/docs/b">B</a><a href="https://other.com/docs/c">C</a><a href="/blog">Blog</a>',
+    "https://example.com/docs/a": b'<a href="/docs/a/1">A1</a><a href="/docs/b">B</a><a href="/docs">Home</a>',
+    "https://example.com/docs/b": b'<p>No links here</p>',
+    "https://example.com/docs/a/1": b'<a href="/docs/z">Z</a>',
+}
+
+
+class FakeResponse:
+    def __init__(self, content, url, content_type="text/html; charset=utf-8"):
+        self.content = content
+        self.url = url
+        self.status_code = 200
+        self.headers = {"Content-Type": content_type}
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8")
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i:i + chunk_size]
+
+    def close(self):
+        pass
+
+
+class FakeSession:
+    """Serves pages from a url -> body dict and records every fetched URL."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.fetched = []
+
+    def get(self, url, timeout=None, stream=False):
+        self.fetched.append(url)
+        return FakeResponse(self.pages.get(url, b"<p>missing</p>"), url)
+
+
+@pytest.fixture
+def docs_site(monkeypatch):
+    """Install a FakeSession serving DOCS_SITE as the shared page client."""
+    session = FakeSession(DOCS_SITE)
+    monkeypatch.setattr('tools.unifero._get_page_client', lambda: session)
+    return session
+
+
+def test_extract_html_title_and_paragraphs():
+    resp = FakeResponse(PAGE, "https://example.com/docs/routing")
+    title, paragraphs, favicon, og_image = extract_html_title_and_paragraphs(resp)
+
+    assert title == "Routing Guide | Example Docs"
+    assert favicon == "https://example.com/favicon.ico"
+    assert og_image == "https://example.com/img/og.png"
+
+    assert paragraphs[0] == "Getting Started"
+    assert "Use the app directory for new projects today." in paragraphs
+    # pre>code is emitted once, as a fenced block
+    assert paragraphs.count("```\nexport default function Page() {\n  return <h1>Hello</h1>\n}\n```") == 1
+    assert "Café — unicode content should survive the parser round trip." in paragraphs
+    # short items, boilerplate and scripts are dropped
+    assert "tiny" not in paragraphs
+    assert not any("removed entirely" in p or "Introduction" in p or "var x" in p for p in paragraphs)
+
+
+def test_extract_uses_declared_charset():
+    html = "<html><head><title>Caf\u00e9 docs</title></head><body></body></html>".encode("latin-1")
+    resp = FakeResponse(html, "https://example.com/", content_type="text/html; charset=ISO-8859-1")
+    title, _, _, _ = extract_html_title_and_paragraphs(resp)
+    assert title == "Caf\u00e9 docs"
+
+
+def test_extract_preview_image_priority_and_head_scope():
+    html = (
+        b'<html><head><meta name="twitter:image" content="/tw.png">'
+        b'<meta property="og:image" content=""><meta name="og:image" content="/og.png">'
+        b'<link rel="ICON" href="/a.ico"></head>'
+        b'<body><link rel="icon" href="/b.ico"><p>Body text long enough to be kept around.</p></body></html>'
+    )
+    _, _, favicon, og_image = extract_html_title_and_paragraphs(FakeResponse(html, "https://example.com/"))
+    assert favicon == "https://example.com/a.ico"
+    assert og_image == "https://example.com/og.png"
+
+    # a body-only node in <head> makes libxml2 move the rest of it into <body>
+    html = (
+        b'<html><head><title>T</title><div>banner</div>'
+        b'<link rel="icon" href="/late.ico"><meta property="og:image" content="/late.png">'
+        b'</head><body></body></html>'
+    )
+    _, _, favicon, og_image = extract_html_title_and_paragraphs(FakeResponse(html, "https://example.com/"))
+    assert favicon == "https://example.com/late.ico"
+    assert og_image == "https://example.com/late.png"
+
+
+def test_duckduckgo_search_parses_result_links():
+    session = FakeSession({"https://duckduckgo.com/html/?q=next.js": SEARCH_PAGE})
+    links = duckduckgo_search("next.js", limit=3, session=session)
+
+    # uddg redirects are unwrapped, duplicates and fragments skipped, and
+    # result links come before other anchors
+    assert links == ["https://nextjs.org/docs", "https://vercel.com/guides", "https://duckduckgo.com/about"]
+
+
+def test_crawl_docs_follows_same_domain_doc_links(docs_site):
+    assert crawl_docs("https://example.com/docs", limit=50) == [
+        "https://example.com/docs/a",
+        "https://example.com/docs/a/1",
+        "https://example.com/docs/b",
+        "https://example.com/docs/z",
+    ]
+    assert len(crawl_docs("https://example.com/docs", limit=2)) == 2
+
+
+def test_fetch_docs_data_reuses_crawled_pages(docs_site):
+    data = fetch_docs_data("https://example.com/docs", limit=3)
+
+    assert [r["url"] for r in data["results"]] == [
+        "https://example.com/docs",
+        "https://example.com/docs/a",
+        "https://example.com/docs/a/1",
+    ]
+    assert all(r["fetched"] for r in data["results"])
+    # every page was downloaded once, by the crawl
+    assert sorted(docs_site.fetched) == sorted(set(docs_site.fetched))
+
+
+def test_safe_get_with_httpx_client_retries_and_caps_body(monkeypatch):
+    statuses = iter([None, 503, 200])
+
+    def handler(request):
+        status = next(statuses)
+        if status is None:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(status, content=b"x" * 50)
+
+    monkeypatch.setattr('tools.unifero.time.sleep', lambda s: None)
+    monkeypatch.setattr('tools.unifero.MAX_RESPONSE_BYTES', 10)
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    resp = safe_get(client, "https://example.com/docs")
+
+    assert resp.status_code == 200
+    assert resp.content == b"x" * 10
+    assert safe_get(httpx.Client(transport=httpx.MockTransport(lambda r: httpx.Response(404))), "https://example.com/") is None
+
+
+def test_enable_dns_cache_reuses_lookups(monkeypatch):
+    calls = []
+
+    def fake_getaddrinfo(host, port, *args, **kwargs):
+        calls.append(host)
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", port))]
+
+    monkeypatch.setattr(socket, "getaddrinfo", fake_getaddrinfo)
+    monkeypatch.setattr('tools.unifero._DNS_CACHE_INSTALLED', False)
+
+    enable_dns_cache(ttl=60)
+    enable_dns_cache(ttl=60)  # idempotent
+
+    first = socket.getaddrinfo("example.com", 443)
+    second = socket.getaddrinfo("example.com", 443)
+    socket.getaddrinfo("example.org", 443)
+
+    assert first == second
+    assert calls == ["example.com", "example.org"]
+
+
+def test_extract_doc_content_html_caps_work_without_changing_content(monkeypatch):
+    section = b'<h2>Section Title</h2><p>Some paragraph text that is long enough to keep.</p><pre><code>def f():\n    return 1</code></pre>'
+    page = b"<html><body>" + section * 500 + b"</body></html>"
+    monkeypatch.setattr('tools.unifero.safe_get', lambda session, url: FakeResponse(page, url))
+
+    full = extract_doc_content_html("https://example.com/docs", length=None, session=object())
+    capped = extract_doc_content_html("https://example.com/docs", length=300, session=object())
+
+    assert capped["content"] == full["content"][:300]
+    assert len(capped["paragraphs"]) < len(full["paragraphs"])
+
+    # content_len=0 still yields the first paragraph for search snippets
+    empty = extract_doc_content_html("https://example.com/docs", length=0, session=object())
+    assert empty["content"] == ""
+    assert empty["paragraphs"] == full["paragraphs"][:1]
+
+    # a negative length slices from the end, so nothing can be skipped
+    negative = extract_doc_content_html("https://example.com/docs", length=-1, session=object())
+    assert negative["content"] == full["content"][:-1]
@@ -5,15 +5,27 @@ Contains the UniferoTool class which exposes process_request for programmatic us
 Features enhanced networking with retries, improved HTML parsing for code extraction,
 and robust error handling.
 """
-from typing import Optional, List, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Iterable, Tuple, Union
 import logging
 import re
-from urllib.parse import urljoin, urlparse, parse_qs
+import socket
+import threading
+import time
+from urllib.parse import urljoin, urlparse, parse_qs, quote_plus
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
+
+try:
+    import httpx
+except ImportError:  # httpx is optional; page fetches fall back to requests
+    httpx = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -26,31 +38,237 @@ HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; unifero-cli/1.0)"}
 DEFAULT_TIMEOUT = 10
 SEARCH_TIMEOUT = 15
 
+# Page bodies are truncated to this many (decompressed) bytes; extraction only
+# ever keeps the first few thousand characters of content.
+MAX_RESPONSE_BYTES = 1_000_000
+
+# Idle connections kept alive: per host by the shared requests session, in
+# total by the httpx page client. Neither caps how many connections are open.
+POOL_SIZE = 32
+
+# Upstream statuses treated as transient and retried
+RETRY_STATUSES = (500, 502, 503, 504)
+PAGE_RETRIES = 3
+
+# Maximum number of pages fetched concurrently by deep_search/fetch_docs_data
+FETCH_WORKERS = 8
+
+# Modes understood by UniferoTool.process_request
+VALID_MODES = frozenset({"search", "docs"})
+
+# Tags whose subtrees are boilerplate or non-visible and are stripped before extraction
+SKIP_TAGS = frozenset({"script", "style", "nav", "footer", "header", "aside", "svg", "noscript"})
+# Tags whose text is collected into paragraphs
+CONTENT_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6", "p", "li", "pre", "code", "blockquote"})
+
+# Short title-like paragraphs rendered as "## " headings in extracted content
+_HEADING_RE = re.compile(r"^[A-Z][A-Za-z0-9\-\s]{2,}$")
+_MULTINEWLINE_RE = re.compile(r"\n{3,}")
+
+# charset declarations in a Content-Type header or an early <meta> tag
+_CHARSET_RE = re.compile(r"""charset=["']?([\w.:-]+)""", re.IGNORECASE)
+_META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset=["']?([\w.:-]+)""", re.IGNORECASE)
+
+# Either HTTP client accepted by safe_get and the extractors
+HTTPClient = Union[requests.Session, "httpx.Client"]
+
+# Exceptions raised by either client for network-level failures
+_NETWORK_ERRORS: Tuple[type, ...] = (requests.exceptions.RequestException,)
+if httpx is not None:
+    _NETWORK_ERRORS += (httpx.HTTPError,)
+
+# <head> metadata lookups for favicons and preview images
+_ICON_LINKS = etree.XPath(".//link[@href][contains(translate(@rel, 'ICON', 'icon'), 'icon')]")
+_IMAGE_METAS = etree.XPath(
+    ".//meta[@content != ''][@property='og:image' or @name='og:image'"
+    " or @property='twitter:image' or @name='twitter:image']"
+)
+_IMAGE_META_PRIORITY = (
+    ("property", "og:image"),
+    ("name", "og:image"),
+    ("property", "twitter:image"),
+    ("name", "twitter:image"),
+)
+
+# CSS classes marking result links on DuckDuckGo's HTML results page
+_RESULT_CLASSES = frozenset({"result__a", "result-link"})
 
-def _build_session(timeout: int = 10) -> requests.Session:
+
+def _build_session(timeout: int = 10, pool_size: int = POOL_SIZE) -> requests.Session:
     """Create a requests.Session with a retry strategy.
 
-    Returns a session that retries on common transient errors.
+    Returns a session that retries on common transient errors and keeps up to
+    pool_size connections per host alive for reuse.
     """
     session = requests.Session()
     retries = Retry(
-        total=3,
+        total=PAGE_RETRIES,
         backoff_factor=0.3,
-        status_forcelist=(500, 502, 503, 504),
+        status_forcelist=RETRY_STATUSES,
         allowed_methods=frozenset(["GET", "POST"]),
     )
-    adapter = HTTPAdapter(max_retries=retries)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     session.headers.update(HEADERS)
     return session
 
 
+_DEFAULT_SESSION: Optional[requests.Session] = None
+_DEFAULT_SESSION_LOCK = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Return the process-wide session, creating it on first use.
+
+    Sharing one session lets repeat requests to a host reuse kept-alive
+    connections instead of paying DNS + TCP + TLS setup every time.
+    """
+    global _DEFAULT_SESSION
+    if _DEFAULT_SESSION is None:
+        with _DEFAULT_SESSION_LOCK:
+            if _DEFAULT_SESSION is None:
+                _DEFAULT_SESSION = _build_session()
+    return _DEFAULT_SESSION
+
+
+def _build_http2_client(pool_size: int = POOL_SIZE) -> "httpx.Client":
+    """Create an httpx.Client that negotiates HTTP/2 where servers support it.
+
+    Concurrent fetches to one host are multiplexed as streams over a single
+    connection (one TLS handshake) instead of one connection per worker.
+    Raises ImportError if the h2 package is not installed.
+    """
+    # Like the requests adapter, open extra connections under load instead of
+    # queueing for a pooled one (which would count against the timeout)
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=pool_size)
+    # no explicit transport=: httpx only honours HTTP(S)_PROXY/NO_PROXY when
+    # it builds the transports itself. Retries are handled by _httpx_get.
+    return httpx.Client(http2=True, limits=limits, headers=HEADERS, follow_redirects=True)
+
+
+_PAGE_CLIENT: Optional[HTTPClient] = None
+_PAGE_CLIENT_LOCK = threading.Lock()
+
+
+def _get_page_client() -> HTTPClient:
+    """Return the process-wide client used to fetch pages.
+
+    An HTTP/2 httpx client when httpx[http2] is installed, otherwise the
+    shared requests session.
+    """
+    global _PAGE_CLIENT
+    if _PAGE_CLIENT is None:
+        with _PAGE_CLIENT_LOCK:
+            if _PAGE_CLIENT is None:
+                client = None
+                if httpx is not None:
+                    try:
+                        client = _build_http2_client()
+                    except ImportError as e:
+                        logger.debug("HTTP/2 client unavailable, using requests: %s", e)
+                _PAGE_CLIENT = client if client is not None else _get_session()
+    return _PAGE_CLIENT
+
+
+_DNS_CACHE_INSTALLED = False
+_DNS_CACHE_MAXSIZE = 1024
+
+
+def enable_dns_cache(ttl: float = 300.0) -> None:
+    """Cache socket.getaddrinfo results for ttl seconds, process-wide.
+
+    Every new connection (crawl workers, retries, new hosts) otherwise pays a
+    synchronous DNS lookup. Opt-in because it patches the socket module for
+    the whole process and ignores the records' own TTLs; api.py and main.py
+    only call it when UNIFERO_DNS_CACHE_TTL is set. Calling it again is a
+    no-op.
+    """
+    global _DNS_CACHE_INSTALLED
+    if _DNS_CACHE_INSTALLED:
+        return
+
+    original = socket.getaddrinfo
+    cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+    lock = threading.Lock()
+
+    def cached_getaddrinfo(*args: Any, **kwargs: Any) -> Any:
+        key = (args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        with lock:
+            hit = cache.get(key)
+        if hit is not None and now - hit[0] < ttl:
+            return list(hit[1])
+        result = original(*args, **kwargs)
+        with lock:
+            if len(cache) >= _DNS_CACHE_MAXSIZE:
+                cache.clear()
+            cache[key] = (now, result)
+        return list(result)
+
+    socket.getaddrinfo = cached_getaddrinfo
+    _DNS_CACHE_INSTALLED = True
+
+
+def _detect_encoding(resp: requests.Response) -> str:
+    """Return the response charset from the Content-Type header or a <meta> tag.
+
+    Defaults to UTF-8, which is what undeclared pages use in practice
+    (libxml2 would otherwise assume Latin-1).
+    """
+    match = _CHARSET_RE.search(resp.headers.get("Content-Type", ""))
+    if match:
+        return match.group(1)
+    match = _META_CHARSET_RE.search(resp.content[:2048])
+    if match:
+        return match.group(1).decode("ascii")
+    return "utf-8"
+
+
+def _parse(resp: requests.Response) -> Optional[lxml.html.HtmlElement]:
+    """Parse a response body into an lxml HTML tree (None if it is empty).
+
+    lxml's C parser and tree are much faster than BeautifulSoup for the
+    simple tag/text extraction done here.
+    """
+    try:
+        parser = lxml.html.HTMLParser(encoding=_detect_encoding(resp))
+    except LookupError:
+        parser = lxml.html.HTMLParser(encoding="utf-8")
+    try:
+        return lxml.html.document_fromstring(resp.content, parser=parser)
+    except (etree.ParserError, ValueError):
+        return None
+
+
+def _text(el: lxml.html.HtmlElement, separator: str = " ") -> str:
+    """Join the stripped, non-empty text nodes under el (like bs4's get_text(sep, strip=True))."""
+    return separator.join(t.strip() for t in el.itertext() if t.strip())
+
+
+def _preview_image(scope: lxml.html.HtmlElement) -> Optional[str]:
+    """Return the content of the highest-priority og:image/twitter:image meta in scope."""
+    found: Dict[Tuple[str, str], str] = {}
+    for meta in _IMAGE_METAS(scope):
+        for attr in ("property", "name"):
+            key = meta.get(attr)
+            if key is not None:
+                found.setdefault((attr, key), meta.get("content"))
+    for key in _IMAGE_META_PRIORITY:
+        if key in found:
+            return found[key]
+    return None
+
+
+@lru_cache(maxsize=4096)
 def normalize_url(href: str, base: Optional[str] = None) -> Optional[str]:
     """Normalize hrefs found on pages to absolute URLs when possible.
 
     Handles common redirect wrappers (e.g. DuckDuckGo uddg) and protocol-relative
     URLs. Returns None for javascript and fragment links.
+
+    Results are memoized: pages repeat the same nav/sidebar/footer hrefs many
+    times, and urlparse/urljoin are comparatively expensive.
     """
     if not href:
         return None
@@ -82,15 +300,58 @@ def normalize_url(href: str, base: Optional[str] = None) -> Optional[str]:
     return None
 
 
-def safe_get(session: requests.Session, url: str, timeout: int = DEFAULT_TIMEOUT) -> Optional[requests.Response]:
-    """Perform a GET request using the provided session and return the response or None."""
+def _read_capped(chunks: Iterable[bytes], max_bytes: int) -> bytes:
+    """Join body chunks, stopping once max_bytes have been read."""
+    parts: List[bytes] = []
+    size = 0
+    for chunk in chunks:
+        parts.append(chunk)
+        size += len(chunk)
+        if size >= max_bytes:
+            return b"".join(parts)[:max_bytes]
+    return b"".join(parts)
+
+
+def _httpx_get(client: "httpx.Client", url: str, timeout: int) -> Optional["httpx.Response"]:
+    """safe_get for httpx clients: retry connect errors and transient statuses, then read a capped body."""
+    for attempt in range(PAGE_RETRIES + 1):
+        retry = attempt < PAGE_RETRIES
+        try:
+            with client.stream("GET", url, timeout=httpx.Timeout(timeout, pool=None)) as resp:
+                if resp.status_code not in RETRY_STATUSES or not retry:
+                    if resp.status_code != 200:
+                        logger.debug("safe_get: non-200 status %s for %s", resp.status_code, url)
+                        return None
+                    resp._content = _read_capped(resp.iter_bytes(64 * 1024), MAX_RESPONSE_BYTES)
+                    return resp
+        except httpx.ConnectError:
+            if not retry:
+                raise
+        # back off only after the stream is closed, so no connection is held
+        time.sleep(0.3 * (2 ** attempt))
+    return None
+
+
+def safe_get(session: HTTPClient, url: str, timeout: int = DEFAULT_TIMEOUT) -> Optional[Any]:
+    """Perform a GET request using the provided session and return the response or None.
+
+    session may be a requests.Session or an httpx.Client. The body is
+    streamed and capped at MAX_RESPONSE_BYTES, so huge pages cost bounded
+    bandwidth, memory and parse time; an over-long body's connection is
+    dropped rather than returned to the pool half-read.
+    """
     try:
-        resp = session.get(url, timeout=timeout)
+        if httpx is not None and isinstance(session, httpx.Client):
+            return _httpx_get(session, url, timeout)
+        resp = session.get(url, timeout=timeout, stream=True)
         if resp.status_code != 200:
             logger.debug("safe_get: non-200 status %s for %s", resp.status_code, url)
+            resp.close()
             return None
+        resp._content = _read_capped(resp.iter_content(chunk_size=64 * 1024), MAX_RESPONSE_BYTES)
+        resp.close()
         return resp
-    except requests.exceptions.RequestException as e:
+    except _NETWORK_ERRORS as e:
         logger.debug("safe_get exception for %s: %s", url, e)
         return None
     except Exception as e:
@@ -98,97 +359,124 @@ def safe_get(session: requests.Session, url: str, timeout: int = DEFAULT_TIMEOUT
         return None
 
 
-def extract_html_title_and_paragraphs(resp: requests.Response) -> Tuple[Optional[str], List[str], Optional[str], Optional[str]]:
+def extract_html_title_and_paragraphs(resp: requests.Response, max_chars: Optional[int] = None) -> Tuple[Optional[str], List[str], Optional[str], Optional[str]]:
     """Parse HTML response and extract title, paragraphs, favicon and og:image.
 
     Returns (title, paragraphs, favicon, og_image). favicon and og_image will be
     normalized to absolute URLs when possible using resp.url as the base.
-    """
-    soup = BeautifulSoup(resp.text, "html.parser")
-    title_tag = soup.find("title")
-    title = title_tag.get_text(" ", strip=True) if title_tag else None
 
-    # Extract favicon: look for link rel containing 'icon'
+    If max_chars is given and not negative, paragraph collection stops once
+    about twice that much text has been gathered (headroom for the heading
+    markup added by extract_doc_content_html), since callers truncate content
+    to max_chars. At least one paragraph is always collected, even for
+    max_chars=0.
+    """
+    doc = _parse(resp)
+    if doc is None:
+        return None, [], None, None
+    base_url = str(resp.url)
+
+    title_tag = doc.find(".//title")
+    title = _text(title_tag) if title_tag is not None else None
+
+    # favicon and preview image are declared in <head>, so look there first.
+    # libxml2 closes <head> at the first body-only node, though, moving any
+    # later <link>/<meta> into <body>; fall back to the whole document.
+    head = doc.find("head")
+    scopes = (head, doc) if head is not None else (doc,)
     favicon = None
-    for link in soup.find_all("link", href=True):
-        rel = link.get("rel")
-        if not rel:
-            continue
-        # rel can be a list or string
-        rels = [r.lower() for r in rel] if isinstance(rel, (list, tuple)) else [rel.lower()]
-        if any("icon" in r for r in rels):
-            href = link.get("href")
-            favicon = normalize_url(href, base=resp.url)
-            if favicon:
-                break
-
-    # Extract Open Graph image (preview)
     og_image = None
-    og_tag = soup.find("meta", property="og:image") or soup.find("meta", attrs={"name": "og:image"})
-    if og_tag and og_tag.get("content"):
-        og_image = normalize_url(og_tag.get("content"), base=resp.url)
-    else:
-        # Fallback: twitter:image
-        tw_tag = soup.find("meta", property="twitter:image") or soup.find("meta", attrs={"name": "twitter:image"})
-        if tw_tag and tw_tag.get("content"):
-            og_image = normalize_url(tw_tag.get("content"), base=resp.url)
-
-    for tag in soup(["script", "style", "nav", "footer", "header", "aside", "svg", "noscript"]):
-        tag.decompose()
+    for scope in scopes:
+        if favicon is None:
+            # first link whose rel contains 'icon'
+            for link in _ICON_LINKS(scope):
+                favicon = normalize_url(link.get("href"), base=base_url)
+                if favicon:
+                    break
+        if og_image is None:
+            # Open Graph image (preview), falling back to twitter:image
+            image = _preview_image(scope)
+            if image:
+                og_image = normalize_url(image, base=base_url)
+        if favicon is not None and og_image is not None:
+            break
 
     paragraphs: List[str] = []
-    
-    # Enhanced extraction: Handle code blocks and preserve formatting
-    for tag in soup.find_all(["h1", "h2", "h3", "h4", "h5", "h6", "p", "li", "pre", "code", "blockquote"]):
+    # unfenced text of everything collected so far, for inline-code dedup
+    seen_code = set()
+    # negative lengths slice from the end of the content, so need everything
+    budget = max_chars * 2 if max_chars is not None and max_chars >= 0 else None
+    collected = 0
+
+    # Drop boilerplate subtrees in one C-level call (keeping the text that
+    # follows them), then visit headings/paragraphs/code in document order.
+    etree.strip_elements(doc, *SKIP_TAGS, with_tail=False)
+    for tag in doc.iter(*CONTENT_TAGS):
+        # always keep the first paragraph: deep_search snippets come from it
+        if budget is not None and paragraphs and collected >= budget:
+            break
+        name = tag.tag
+
         # Handle code blocks with special formatting
-        if tag.name in ["pre", "code"]:
-            code_text = tag.get_text(separator="\n", strip=False)
-            if code_text.strip() and len(code_text.strip()) >= 10:  # Only include substantial code
+        if name in ("pre", "code"):
+            # the enclosing <pre> already emitted this text (pre>code, pre>span>code)
+            if next(tag.iterancestors("pre"), None) is not None:
+                continue
+            pieces = list(tag.itertext())
+            code_text = "\n".join(pieces).strip()
+            if code_text and len(code_text) >= 10:  # Only include substantial code
                 # Mark as code block for better identification
-                formatted_code = f"```\n{code_text.strip()}\n```"
-                paragraphs.append(formatted_code)
+                paragraphs.append(f"```\n{code_text}\n```")
+                seen_code.add(code_text)
+                collected += len(code_text) + 10
+            # Also keep inline code whose compact form differs from the block
+            if name == "code":
+                inline_text = "".join(p.strip() for p in pieces)
+                if len(inline_text) >= 20 and inline_text not in seen_code:
+                    seen_code.add(inline_text)
+                    paragraphs.append(f"`{inline_text}`")
+                    collected += len(inline_text) + 4
         else:
-            text = tag.get_text(" ", strip=True)
+            text = _text(tag)
             if not text:
                 continue
             # Reduce minimum length for headers and important elements
-            min_length = 10 if tag.name.startswith('h') else 20
+            min_length = 10 if name.startswith('h') else 20
             if len(text) < min_length:
                 continue
             paragraphs.append(text)
-    
-    # Also extract any remaining code that might be in other elements
-    for code_tag in soup.find_all("code"):
-        if code_tag.parent and code_tag.parent.name != "pre":  # Avoid duplicates from pre>code
-            code_text = code_tag.get_text(strip=True)
-            if code_text and len(code_text) >= 20 and code_text not in [p.replace('```\n', '').replace('\n```', '') for p in paragraphs]:
-                paragraphs.append(f"`{code_text}`")
+            seen_code.add(text)
+            collected += len(text) + 2
     
     return title, paragraphs, favicon, og_image
 
 
-def extract_doc_content_html(url: str, length: Optional[int] = 2000, session: Optional[requests.Session] = None) -> Optional[Dict[str, Any]]:
+def extract_doc_content_html(url: str, length: Optional[int] = 2000, session: Optional[HTTPClient] = None) -> Optional[Dict[str, Any]]:
     """Backward-compatible extractor: call with (url, length) or (url, length, session).
 
-    If session is not provided, a session will be created internally.
+    If session is not provided, the shared page client is used.
     """
     if session is None:
-        session = _build_session()
+        session = _get_page_client()
     resp = safe_get(session, url)
     if not resp:
         return None
+    return _doc_content(resp, length)
+
 
-    title, paragraphs, favicon, og_image = extract_html_title_and_paragraphs(resp)
+def _doc_content(resp: Any, length: Optional[int]) -> Dict[str, Any]:
+    """Build the extract_doc_content_html result for an already fetched page."""
+    title, paragraphs, favicon, og_image = extract_html_title_and_paragraphs(resp, max_chars=length)
 
     content_lines: List[str] = []
     for p in paragraphs:
-        if re.match(r"^[A-Z][A-Za-z0-9\-\s]{2,}$", p) and len(p.split()) <= 6:
+        if _HEADING_RE.match(p) and len(p.split()) <= 6:
             content_lines.append(f"\n## {p}\n")
         else:
             content_lines.append(p)
 
     text = "\n\n".join(content_lines)
-    text = re.sub(r"\n{3,}", "\n\n", text).strip()
+    text = _MULTINEWLINE_RE.sub("\n\n", text).strip()
     if length is None:
         return {"title": title or "", "paragraphs": paragraphs, "content": text, "favicon": favicon, "og_image": og_image}
     return {"title": title or "", "paragraphs": paragraphs, "content": text[:length], "favicon": favicon, "og_image": og_image}
@@ -200,9 +488,8 @@ def duckduckgo_search(query: str, limit: int = 10, session: Optional[requests.Se
     Backward-compatible signature: duckduckgo_search(query, limit) or duckduckgo_search(query, limit, session=...)
     """
     if session is None:
-        session = _build_session()
-    q = query.replace(" ", "+")
-    url = f"https://duckduckgo.com/html/?q={q}"
+        session = _get_session()
+    url = f"https://duckduckgo.com/html/?q={quote_plus(query)}"
     try:
         resp = session.get(url, timeout=10)
         if resp.status_code != 200:
@@ -212,29 +499,61 @@ def duckduckgo_search(query: str, limit: int = 10, session: Optional[requests.Se
         logger.debug("duckduckgo_search exception for %s: %s", url, e)
         return []
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    doc = _parse(resp)
+    if doc is None:
+        return []
     links: List[str] = []
     seen = set()
+    # non-result anchors are only used to top up when there are too few results
+    fallback: List[str] = []
 
-    for a in soup.select("a.result__a, a.result-link"):
+    # One pass over the anchors: result links are taken in order (stopping as
+    # soon as there are enough) and everything else is kept for the top-up.
+    for a in doc.iter("a"):
         href = a.get("href")
+        if href is None:
+            continue
         final = normalize_url(href)
-        if final and final not in seen:
+        if not final:
+            continue
+        if _RESULT_CLASSES.isdisjoint((a.get("class") or "").split()):
+            fallback.append(final)
+        elif final not in seen:
             seen.add(final)
             links.append(final)
-        if len(links) >= limit:
-            return links
+            if len(links) >= limit:
+                return links
 
-    for a in soup.find_all("a", href=True):
+    for final in fallback:
         if len(links) >= limit:
             break
-        href = a["href"]
-        final = normalize_url(href)
-        if final and final not in seen:
+        if final not in seen:
             seen.add(final)
             links.append(final)
 
-    return links[:limit]
+    return links
+
+
+def _extract_many(links: List[str], length: Optional[int], pages: Optional[Dict[str, Any]] = None) -> List[Optional[Dict[str, Any]]]:
+    """Run extract_doc_content_html over links concurrently, preserving order.
+
+    Page fetches are independent and I/O-bound, so wall time is roughly the
+    slowest page rather than the sum of all of them. Links found in pages
+    (url -> response, see crawl_docs) are extracted without refetching.
+    """
+    if not links:
+        return []
+
+    def extract(link: str) -> Optional[Dict[str, Any]]:
+        logger.info("Extracting: %s", link)
+        resp = pages.get(link) if pages else None
+        if resp is not None:
+            return _doc_content(resp, length)
+        # keep compatibility with monkeypatched extractors by not forcing a session
+        return extract_doc_content_html(link, length=length)
+
+    with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(links))) as ex:
+        return list(ex.map(extract, links))
 
 
 def deep_search(query: str, limit: int = 5, snippet_len: int = 300, content_len: Optional[int] = 2000) -> Dict[str, Any]:
@@ -243,10 +562,7 @@ def deep_search(query: str, limit: int = 5, snippet_len: int = 300, content_len:
     links = duckduckgo_search(query, limit=limit)
     results: List[Dict[str, Any]] = []
 
-    for link in links:
-        logger.info("Extracting: %s", link)
-        # keep compatibility with monkeypatched extractors by not forcing a session
-        extracted = extract_doc_content_html(link, length=content_len)
+    for link, extracted in zip(links, _extract_many(links, content_len)):
         if not extracted:
             results.append({"url": link, "title": None, "snippet": None, "content": None})
             continue
@@ -273,41 +589,70 @@ def deep_search(query: str, limit: int = 5, snippet_len: int = 300, content_len:
     return {"query": query, "results": results}
 
 
+# Set by fetch_docs_data for the duration of its crawl_docs call: crawl_docs
+# records every HTML page it fetched (url -> response) there, so the pages
+# can be extracted afterwards without downloading them again. Passed this way
+# rather than as an argument to keep crawl_docs' signature (and monkeypatched
+# replacements of it) unchanged.
+_CRAWLED_PAGES: ContextVar[Optional[Dict[str, Any]]] = ContextVar("_CRAWLED_PAGES", default=None)
+
+
 def crawl_docs(base_url: str, limit: int = 50) -> List[str]:
-    session = _build_session()
+    session = _get_page_client()
+    crawled = _CRAWLED_PAGES.get()
     visited = set()
     to_visit = [base_url]
     domain = urlparse(base_url).netloc
+    # Same-domain test without a urlparse per anchor; the trailing delimiter
+    # stops "example.com" from matching "example.com.evil.org".
+    same_domain_prefixes = tuple(
+        f"{scheme}://{domain}{delim}" for scheme in ("https", "http") for delim in ("/", "?", "#")
+    )
     docs_links = set()
 
     logger.info("Starting crawl: %s", base_url)
 
-    while to_visit and len(docs_links) < limit:
-        url = to_visit.pop(0)
-        if url in visited:
-            continue
-        visited.add(url)
-
-        try:
-            resp = session.get(url, timeout=10)
-            if resp is None or resp.status_code != 200:
-                continue
-            ctype = resp.headers.get("Content-Type", "")
-            if "text/html" not in ctype:
-                continue
-
-            soup = BeautifulSoup(resp.text, "html.parser")
-            for a in soup.find_all("a", href=True):
-                link = normalize_url(a["href"], base=url)
-                if not link:
+    # Breadth-first, one level at a time: every page of a level is fetched
+    # concurrently, then the responses are parsed in order on this thread so
+    # the bookkeeping below needs no locking.
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as ex:
+        while to_visit and len(docs_links) < limit:
+            # links enter to_visit at most once (see below), so a level never
+            # holds duplicates or already-visited pages
+            level, to_visit = to_visit, []
+            visited.update(level)
+
+            for url, resp in zip(level, ex.map(lambda u: safe_get(session, u), level)):
+                if len(docs_links) >= limit:
+                    break
+                if resp is None:
+                    continue
+                try:
+                    ctype = resp.headers.get("Content-Type", "")
+                    if "text/html" not in ctype:
+                        continue
+                    if crawled is not None:
+                        crawled[url] = resp
+
+                    doc = _parse(resp)
+                    if doc is None:
+                        continue
+                    for a in doc.iter("a"):
+                        href = a.get("href")
+                        if href is None:
+                            continue
+                        link = normalize_url(href, base=url)
+                        if not link:
+                            continue
+                        if link in docs_links or link in visited:
+                            continue
+                        if "/doc" in link and link.startswith(same_domain_prefixes):
+                            if len(docs_links) < limit:
+                                docs_links.add(link)
+                                to_visit.append(link)
+                except Exception as e:
+                    logger.debug("Skipping %s: %s", url, e)
                     continue
-                if urlparse(link).netloc == domain and "/doc" in link:
-                    if link not in visited and len(docs_links) < limit:
-                        docs_links.add(link)
-                        to_visit.append(link)
-        except Exception as e:
-            logger.debug("Skipping %s: %s", url, e)
-            continue
 
     logger.info("Found %s doc links.", len(docs_links))
     return sorted(docs_links)
@@ -321,7 +666,12 @@ def fetch_docs_data(base_url: str, limit: int = 10, include_content: bool = True
     if limit > 10:
         limit = 10
 
-    links = crawl_docs(base_url, limit=limit)
+    crawled: Dict[str, Any] = {}
+    token = _CRAWLED_PAGES.set(crawled)
+    try:
+        links = crawl_docs(base_url, limit=limit)
+    finally:
+        _CRAWLED_PAGES.reset(token)
     links = links[:limit]
     
     # If crawl found no doc links, include the base_url itself so
@@ -334,13 +684,10 @@ def fetch_docs_data(base_url: str, limit: int = 10, include_content: bool = True
         if base_url not in links:
             links = [base_url] + links[:limit-1]
     
-    session = _build_session()
-    for i, link in enumerate(links, start=1):
-        logger.info("(%s/%s) Processing: %s", i, len(links), link)
+    pages = _extract_many(links, content_limit, crawled) if include_content else [None] * len(links)
+    for link, extracted in zip(links, pages):
         item: Dict[str, Any] = {"url": link}
         if include_content:
-            # call without session to stay compatible with simple monkeypatches
-            extracted = extract_doc_content_html(link, length=content_limit)
             if not extracted:
                 # Extraction failed (network/non-200/etc). Provide explicit flags
                 item["title"] = None